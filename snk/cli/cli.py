@@ -2,13 +2,16 @@ import inspect
 import platform
 
 import typer
+from typer.core import TyperGroup
 from pathlib import Path
 from typing import Optional
 import os
 
+try:
+    from functools import cached_property
+except ImportError:  # python 3.7
+    cached_property = property
 
-from snakemake import SNAKEFILE_CHOICES
-from art import text2art
 
 from snk.cli.dynamic_typer import DynamicTyper
 from snk.cli.subcommands import EnvApp, ConfigApp, RunApp, ScriptApp
@@ -20,6 +23,14 @@ from .config.config import (
 from .options.utils import build_dynamic_cli_options
 from snk.pipeline import Pipeline
 
+# snakemake.SNAKEFILE_CHOICES, repeated so finding the Snakefile doesn't import snakemake
+SNAKEFILE_CHOICES = [
+    "Snakefile",
+    "snakefile",
+    "workflow/Snakefile",
+    "workflow/snakefile",
+]
+
 
 class CLI(DynamicTyper):
     """
@@ -66,16 +77,13 @@ class CLI(DynamicTyper):
         ):
             os.environ["CONDA_SUBDIR"] = "osx-64"
 
-        # dynamically create the logo
-        self.logo = self._create_logo(
-            tagline=self.snk_config.tagline, font=self.snk_config.font
-        )
+        # the logo is created when the help is shown
         callback = self._create_callback()
-        callback.__doc__ = self.logo
 
         # registration
         self.register_callback(
             callback,
+            cls=self._create_group_class(),
             invoke_without_command=True,
             context_settings={"help_option_names": ["-h", "--help"]},
         )
@@ -90,7 +98,6 @@ class CLI(DynamicTyper):
             snakefile=self.snakefile,
             pipeline=self.pipeline,
             verbose=self.verbose,
-            logo=self.logo,
             dynamic_run_options=self.options,
         )
         # Subcommands
@@ -166,6 +173,25 @@ class CLI(DynamicTyper):
 
         return callback
 
+    def _create_group_class(self):
+        cli = self
+
+        class LogoGroup(TyperGroup):
+            """A command group that uses the pipeline logo as its help text."""
+
+            def format_help(self, ctx, formatter):
+                self.help = cli.logo
+                return super().format_help(ctx, formatter)
+
+        return LogoGroup
+
+    @cached_property
+    def logo(self) -> str:
+        """The pipeline logo, created on first use."""
+        return self._create_logo(
+            tagline=self.snk_config.tagline, font=self.snk_config.font
+        )
+
     def _create_logo(
         self, tagline="A Snakemake pipeline CLI generated with snk", font="small"
     ):
@@ -178,6 +204,8 @@ class CLI(DynamicTyper):
         Examples:
           >>> CLI._create_logo()
         """
+        from art import text2art
+
         if self.snk_config.art:
             art = self.snk_config.art
         else:
@@ -188,12 +216,18 @@ class CLI(DynamicTyper):
 
     def _find_snakefile(self):
         """
-        Search possible snakefile locations.
+        Search possible snakefile locations, unless set in the snk config.
         Returns:
           Path: The path to the snakefile.
         Examples:
           >>> CLI._find_snakefile()
         """
+        if self.snk_config.snakefile:
+            snakefile = self.pipeline.path / self.snk_config.snakefile
+            if not snakefile.exists():
+                raise FileNotFoundError(f"Snakefile not found: {snakefile}")
+            return snakefile
+
         for path in SNAKEFILE_CHOICES:
             if (self.pipeline.path / path).exists():
                 return self.pipeline.path / path
@@ -1,8 +1,7 @@
 from pathlib import Path
 from typing import List, Optional
-import snakemake
 from dataclasses import dataclass, field
-from snk.cli.config.utils import get_version_from_config
+from snk.cli.config.utils import get_version_from_config, load_configfile
 from snk.errors import InvalidSnkConfigError, MissingSnkConfigError
 import yaml
 
@@ -20,7 +19,8 @@ class SnkConfig:
     require_conda: bool = False
     resources: List[Path] = field(default_factory=list)
     cli: dict = field(default_factory=dict)
-    symlink_resources: bool = False
+    symlink_resources: bool = True
+    snakefile: Optional[str] = None
     _snk_config_path: Path = None
 
     @classmethod
@@ -35,7 +35,7 @@ class SnkConfig:
           FileNotFoundError: If the SNK config file is not found.
         Examples:
           >>> SnkConfig.from_path(Path("snk.yaml"))
-          SnkConfig(art=None, logo=None, tagline='A Snakemake pipeline CLI generated with Snk', font='small', resources=[], annotations={}, symlink_resources=False, _snk_config_path=PosixPath('snk.yaml'))
+          SnkConfig(art=None, logo=None, tagline='A Snakemake pipeline CLI generated with Snk', font='small', resources=[], annotations={}, symlink_resources=True, _snk_config_path=PosixPath('snk.yaml'))
         """
         if not snk_config_path.exists():
             raise MissingSnkConfigError(
@@ -45,7 +45,7 @@ class SnkConfig:
         if snk_config_path.stat().st_size == 0:
             raise InvalidSnkConfigError(f"SNK config file is empty: {snk_config_path}") from ValueError
 
-        snk_config_dict = snakemake.load_configfile(snk_config_path)
+        snk_config_dict = load_configfile(snk_config_path)
         snk_config_dict["version"] = get_version_from_config(snk_config_path, snk_config_dict)
         if "annotations" in snk_config_dict:
             # TODO: remove annotations in the future
@@ -74,7 +74,7 @@ class SnkConfig:
           FileNotFoundError: If the SNK config file is not found.
         Examples:
           >>> SnkConfig.from_pipeline_dir(Path("pipeline"))
-          SnkConfig(art=None, logo=None, tagline='A Snakemake pipeline CLI generated with Snk', font='small', resources=[], annotations={}, symlink_resources=False, _snk_config_path=PosixPath('pipeline/snk.yaml'))
+          SnkConfig(art=None, logo=None, tagline='A Snakemake pipeline CLI generated with Snk', font='small', resources=[], annotations={}, symlink_resources=True, _snk_config_path=PosixPath('pipeline/snk.yaml'))
         """
         if (pipeline_dir_path / "snk.yaml").exists():
             return cls.from_path(pipeline_dir_path / "snk.yaml")
@@ -201,4 +201,4 @@ def load_pipeline_snakemake_config(pipeline_dir_path: Path):
     pipeline_config_path = get_config_from_pipeline_dir(pipeline_dir_path)
     if not pipeline_config_path or not pipeline_config_path.exists():
         return {}
-    return snakemake.load_configfile(pipeline_config_path)
+    return load_configfile(pipeline_config_path)
@@ -1,5 +1,48 @@
 from pathlib import Path
-from snakemake import load_configfile
+from snk.errors import InvalidConfigFileError
+
+
+def load_configfile(config_path: Path) -> dict:
+    """
+    Load a JSON or YAML config file as snakemake does, without importing snakemake.
+    Args:
+      config_path (Path): Path to the config file.
+    Returns:
+      dict: The config.
+    Raises:
+      InvalidConfigFileError: If the config is not valid JSON or YAML, or is not a mapping.
+    Notes:
+      YAML files that opt in to YTE templating (__use_yte__) are loaded by snakemake.
+    Examples:
+      >>> load_configfile(Path("config.yaml"))
+      {'inputs': {'data': 'data.txt'}}
+    """
+    import json
+    import yaml
+
+    text = config_path.read_text(encoding="utf-8")
+    try:
+        config = json.loads(text)
+    except ValueError:
+        # snakemake (through yte) loads YAML with the full loader
+        try:
+            config = yaml.load(text, Loader=yaml.FullLoader)
+        except yaml.YAMLError as e:
+            raise InvalidConfigFileError(
+                f"Config file {config_path} is not valid JSON or YAML. "
+                "In case of YAML, make sure to not mix whitespace and tab indentation."
+                f"\n{e}"
+            ) from e
+        if isinstance(config, dict) and "__use_yte__" in config:
+            import snakemake
+
+            return snakemake.load_configfile(config_path)
+    if not isinstance(config, dict):
+        raise InvalidConfigFileError(
+            f"Config file {config_path} must be given as JSON or YAML with keys at top level."
+        )
+    return config
+
 
 def get_version_from_config(config_path: Path, config_dict: dict = None) -> str:
     """
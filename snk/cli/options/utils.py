@@ -1,6 +1,6 @@
-from typing import List
+from typing import Any, Dict, List
 from ..config.config import SnkConfig
-from ..utils import get_default_type, flatten
+from ..utils import get_default_type, walk
 from .option import Option
 from pathlib import Path
 
@@ -20,23 +20,22 @@ types = {
 
 
 def create_option_from_annotation(
-    annotation_key: str, annotation_values: dict, default_values: dict
+    annotation_key: str, annotation_values: dict, config_default: Any = None
 ) -> Option:
     """
     Create an Option object from a given annotation.
     Args:
       annotation_key: The key in the annotations.
-      annotation_values: The dictionary of annotation values.
-      default_values: The dictionary of default values.
+      annotation_values: The dictionary of annotation fields (name, default, type, etc.) for the key.
+      config_default: The default value of the key in the snakemake config.
     Returns:
       An Option object.
     """
-    config_default = default_values.get(annotation_key, None)
-    default = annotation_values.get(f"{annotation_key}:default", config_default)
+    default = annotation_values.get("default", config_default)
     updated = False
     if config_default is None or default != config_default:
         updated = True
-    type = annotation_values.get(f"{annotation_key}:type", get_default_type(default))
+    type = annotation_values.get("type", get_default_type(default))
     assert (
         type is not None
     ), f"Type for {annotation_key} should be one of {', '.join(types.keys())}."
@@ -45,18 +44,36 @@ def create_option_from_annotation(
     )
     return Option(
         name=annotation_values.get(
-            f"{annotation_key}:name", annotation_key.replace(":", "_")
+            "name", annotation_key.replace(":", "_")
         ).replace("-", "_"),
         original_key=annotation_key,
-        default=annotation_values.get(f"{annotation_key}:default", default),
+        default=default,
         updated=updated,
-        help=annotation_values.get(f"{annotation_key}:help", ""),
+        help=annotation_values.get("help", ""),
         type=annotation_type,
-        required=annotation_values.get(f"{annotation_key}:required", False),
-        short=annotation_values.get(f"{annotation_key}:short", None),
+        required=annotation_values.get("required", False),
+        short=annotation_values.get("short", None),
     )
 
 
+def group_annotations(annotations: dict) -> Dict[str, dict]:
+    """
+    Groups nested annotations by the key they annotate.
+    Args:
+      annotations (dict): The nested annotations from the snk config.
+    Returns:
+      Dict[str, dict]: A dictionary mapping each annotated key to its fields.
+    Examples:
+      >>> group_annotations({'a': {'b': {'type': 'int', 'help': 'B'}}})
+      {'a:b': {'type': 'int', 'help': 'B'}}
+    """
+    grouped = {}
+    for key, value in walk(annotations):
+        annotation_key, _, field = key.rpartition(":")
+        grouped.setdefault(annotation_key, {})[field] = value
+    return grouped
+
+
 def build_dynamic_cli_options(
     snakemake_config: dict, snk_config: SnkConfig
 ) -> List[dict]:
@@ -68,20 +85,18 @@ def build_dynamic_cli_options(
     Returns:
       List[dict]: A list of options.
     """
-    flat_config = flatten(snakemake_config)
-    flat_annotations = flatten(snk_config.cli)
+    annotations = group_annotations(snk_config.cli)
     options = {}
 
     # For every parameter in the config, create an option from the corresponding annotation
-    for parameter in flat_config:
+    for parameter, value in walk(snakemake_config):
         options[parameter] = create_option_from_annotation(
-            parameter, flat_annotations, flat_config
+            parameter, annotations.get(parameter, {}), value
         )
 
     # For every annotation not in config, create an option with default values
-    for annotation in flat_annotations:
-        key = ":".join(annotation.split(":")[:-1])
+    for key, annotation_values in annotations.items():
         if key not in options:
-            options[key] = create_option_from_annotation(key, flat_annotations, {})
+            options[key] = create_option_from_annotation(key, annotation_values)
 
     return list(options.values())
@@ -6,12 +6,13 @@ import sys
 from typing import List, Optional
 import typer
 
+try:
+    from functools import cached_property
+except ImportError:  # python 3.7
+    cached_property = property
+
 from snk.cli.dynamic_typer import DynamicTyper
-from snk.cli.workflow import create_workflow
 from snk.pipeline import Pipeline
-from rich.console import Console
-from rich.syntax import Syntax
-from snakemake.deployment.conda import Conda, Env, CreateCondaEnvironmentException
 from snk.cli.config.config import get_config_from_pipeline_dir
 
 
@@ -28,13 +29,6 @@ class EnvApp(DynamicTyper):
         self.snakemake_config = snakemake_config
         self.snakefile = snakefile
         self.configfile = get_config_from_pipeline_dir(self.pipeline.path)
-        self.workflow = create_workflow(
-            self.snakefile,
-            config=self.snakemake_config,
-            configfiles=[self.configfile] if self.configfile else None,
-            use_conda=True,
-            conda_prefix=self.conda_prefix_dir.resolve(),
-        )
         self.register_default_command(self.list)
         self.register_command(self.list, help="List the environments in the pipeline.")
         self.register_command(
@@ -49,6 +43,19 @@ class EnvApp(DynamicTyper):
         self.register_command(self.prune, help="Delete all conda environments.")
         self.register_command(self.create, help="Create all conda environments.")
 
+    @cached_property
+    def workflow(self):
+        """The snakemake workflow, created on first use."""
+        from snk.cli.workflow import create_workflow
+
+        return create_workflow(
+            self.snakefile,
+            config=self.snakemake_config,
+            configfiles=[self.configfile] if self.configfile else None,
+            use_conda=True,
+            conda_prefix=self.conda_prefix_dir.resolve(),
+        )
+
     def list(self):
         environments_dir_yellow = typer.style(
             self.pipeline.path / "envs", fg=typer.colors.YELLOW
@@ -67,6 +74,8 @@ class EnvApp(DynamicTyper):
         return env[0]
 
     def _shellcmd(self, env_address: str, cmd: str) -> str:
+        from snakemake.deployment.conda import Conda
+
         if sys.platform.lower().startswith("win"):
             return Conda().shellcmd_win(env_address, cmd)
         return Conda().shellcmd(env_address, cmd)
@@ -74,6 +83,9 @@ class EnvApp(DynamicTyper):
     def show(
         self, name: str = typer.Argument(..., help="The name of the environment.")
     ):
+        from rich.console import Console
+        from rich.syntax import Syntax
+
         env_path = self._get_conda_env_path(name)
         with open(env_path) as f:
             code = f.read()
@@ -86,6 +98,8 @@ class EnvApp(DynamicTyper):
         name: str = typer.Argument(..., help="The name of the environment."),
         cmd: List[str] = typer.Argument(..., help="The command to run in environment."),
     ):
+        from snakemake.deployment.conda import Env
+
         env_path = self._get_conda_env_path(name)
         env = Env(self.workflow, env_file=env_path.resolve())
         env.create()
@@ -104,6 +118,8 @@ class EnvApp(DynamicTyper):
             self.log(f"Deleted {self.conda_prefix_dir}")
 
     def create(self):
+        from snakemake.deployment.conda import Env, CreateCondaEnvironmentException
+
         for env_path in self.pipeline.environments:
             env = Env(self.workflow, env_file=env_path.resolve())
             try:
@@ -116,6 +132,8 @@ class EnvApp(DynamicTyper):
     def activate(
         self, name: str = typer.Argument(..., help="The name of the environment.")
     ):
+        from snakemake.deployment.conda import Env
+
         env_path = self._get_conda_env_path(name)
         self.log(f"Activating {name} environment... (type 'exit' to deactivate)")
         env = Env(self.workflow, env_file=env_path.resolve())
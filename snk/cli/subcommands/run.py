@@ -2,6 +2,8 @@ from typing import List, Optional
 from pathlib import Path
 import typer
 from contextlib import contextmanager
+import io
+import re
 
 from snk.cli.dynamic_typer import DynamicTyper
 from snk.cli.options.option import Option
@@ -16,6 +18,40 @@ from snk.cli.config.config import (
     get_config_from_pipeline_dir,
 )
 
+_VALID_CONFIG_KEY = re.compile(r"[a-zA-Z_]\w*$")
+
+
+class _DagStream(io.TextIOBase):
+    """
+    A text stream that forwards a snakemake dag to a binary stream.
+    Everything written before 'digraph snakemake_dag' is discarded.
+    """
+
+    marker = "digraph snakemake_dag"
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.found = False
+        self._pending = ""
+
+    def writable(self):
+        return True
+
+    def write(self, s: str) -> int:
+        if self.found:
+            self.stream.write(s.encode())
+            return len(s)
+        self._pending += s
+        _, found, dag = self._pending.partition(self.marker)
+        if not found:
+            # keep enough text to match a marker split across writes
+            self._pending = self._pending[-len(self.marker):]
+            return len(s)
+        self.found = True
+        self._pending = ""
+        self.stream.write(f"{found}{dag}".encode())
+        return len(s)
+
 
 class RunApp(DynamicTyper):
     def __init__(
@@ -25,7 +61,6 @@ class RunApp(DynamicTyper):
         singularity_prefix_dir: Path,
         snakefile: Path,
         pipeline: Pipeline,
-        logo: str,
         verbose: bool,
         dynamic_run_options: List[Option],
     ):
@@ -35,7 +70,6 @@ class RunApp(DynamicTyper):
         self.snakefile = snakefile
         self.pipeline = pipeline
         self.verbose = verbose
-        self.logo = logo
         self.options = dynamic_run_options
 
         self.register_command(
@@ -116,6 +150,12 @@ class RunApp(DynamicTyper):
             "-S",
             help="Keep .snakemake folder after pipeline completes.",
         ),
+        symlink_resources: Optional[bool] = typer.Option(
+            None,
+            "--symlink-resources/--no-symlink-resources",
+            help="Symlink resources into the workdir instead of copying them. Defaults to the pipeline's snk config.",
+            show_default=False,
+        ),
         dag: Optional[Path] = typer.Option(
             None,
             "--dag",
@@ -153,6 +193,7 @@ class RunApp(DynamicTyper):
           resource (List[Path]): Additional resources to copy to workdir at run time.
           keep_resources (bool): Keep resources.
           cleanup_snakemake (bool): Keep .snakemake folder.
+          symlink_resources (bool): Symlink resources instead of copying them. If None will use the snk config.
           cores (int): Set the number of cores to use. If None will use all cores.
           verbose (bool): Run pipeline in verbose mode.
           help_snakemake (bool): Print the snakemake help and exit.
@@ -162,7 +203,6 @@ class RunApp(DynamicTyper):
           >>> CLI.run(target='my_target', configfile=Path('/path/to/config.yaml'), resource=[Path('/path/to/resource')], verbose=True)
         """
         import snakemake
-        import shutil
         import sys
 
         self.verbose = verbose
@@ -232,22 +272,20 @@ class RunApp(DynamicTyper):
         if not lock:
             args.append("--nolock")
 
-        targets_and_or_snakemake, config_dict_list = parse_config_args(
+        targets_and_or_snakemake, config_list = parse_config_args(
             ctx.args, options=self.options
         )
         targets_and_or_snakemake = [
             t.replace("--snake-", "-") for t in targets_and_or_snakemake
         ]
         args.extend(targets_and_or_snakemake)
-        configs = []
-        for config_dict in config_dict_list:
-            for key, value in config_dict.items():
-                configs.append(f"{key}={value}")
+        configs = [f"{key}={value}" for key, value in config_list]
 
         if configs:
             args.extend(["--config", *configs])
         if verbose:
             typer.secho(f"snakemake {' '.join(args)}\n", fg=typer.colors.MAGENTA)
+        remove_stale_deletions(Path(".snakemake"))
         if not keep_snakemake and Path(".snakemake").exists():
             keep_snakemake = True
         try:
@@ -257,7 +295,11 @@ class RunApp(DynamicTyper):
         with self._copy_resources(
             self.snk_config.resources,
             cleanup=not keep_resources,
-            symlink_resources=self.snk_config.symlink_resources,
+            symlink_resources=self.snk_config.symlink_resources
+            if symlink_resources is None
+            else symlink_resources,
+            # only copy when symlinks weren't asked for on the command line
+            copy_if_symlink_fails=symlink_resources is None,
         ):
             if dag:
                 return self._save_dag(snakemake_args=args, filename=dag)
@@ -271,59 +313,68 @@ class RunApp(DynamicTyper):
         if not keep_snakemake and Path(".snakemake").exists():
             if verbose:
                 typer.secho("Deleting '.snakemake' folder...", fg=typer.colors.MAGENTA)
-            shutil.rmtree(".snakemake")
+            remove_in_background(Path(".snakemake"))
 
     def _save_dag(self, snakemake_args: List[str], filename: Path):
         from contextlib import redirect_stdout
         import snakemake
         import subprocess
-        import io
 
         snakemake_args.append("--dag")
 
         fileType = filename.suffix.lstrip(".")
 
-        # Create a file-like object to redirect the stdout
-        snakemake_output = io.StringIO()
-        # Use redirect_stdout to redirect stdout to the file-like object
-        with redirect_stdout(snakemake_output):
-            # Capture the output of snakemake.main(args) using a try-except block
+        with open(filename, "wb") as output_file:
             try:
-                snakemake.parse_config = parse_config_monkeypatch
-                snakemake.main(snakemake_args)
-            except SystemExit:  # Catch SystemExit exception to prevent termination
+                dot_process = subprocess.Popen(
+                    ["dot", f"-T{fileType}"],
+                    stdin=subprocess.PIPE,
+                    stdout=output_file,
+                )
+            except FileNotFoundError:
+                output_file.close()
+                filename.unlink()
+                typer.secho("dot command not found!", fg=typer.colors.RED, err=True)
+                raise typer.Exit(1)
+            if self.verbose:
+                typer.secho(f"Saving dag to {filename}", fg=typer.colors.MAGENTA)
+            # stream the dag into dot as snakemake prints it
+            dag_stream = _DagStream(dot_process.stdin)
+            with redirect_stdout(dag_stream):
+                try:
+                    snakemake.parse_config = parse_config_monkeypatch
+                    snakemake.main(snakemake_args)
+                except SystemExit:  # Catch SystemExit exception to prevent termination
+                    pass
+                except BrokenPipeError:  # dot exited early, checked below
+                    pass
+            try:
+                dot_process.stdin.close()
+            except BrokenPipeError:
                 pass
-        try:
-            snakemake_output = snakemake_output.getvalue()
-            if "snakemake_dag" not in snakemake_output:
-                self.error("Could not generate dag!", exit=True)
-            # discard everything before digraph snakemake_dag
-            filtered_lines = "digraph snakemake_dag" + snakemake_output.split("snakemake_dag")[1]
-            echo_process = subprocess.Popen(
-                ["echo", filtered_lines], stdout=subprocess.PIPE
-            )
-            dot_process = subprocess.Popen(
-                ["dot", f"-T{fileType}"],
-                stdin=echo_process.stdout,
-                stdout=subprocess.PIPE,
-            )
-            with open(filename, "w") as output_file:
-                if self.verbose:
-                    typer.secho(f"Saving dag to {filename}", fg=typer.colors.MAGENTA)
-                subprocess.run(["cat"], stdin=dot_process.stdout, stdout=output_file)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            typer.echo("dot command not found!", fg=typer.colors.RED, err=True)
-            raise typer.Exit(1)
+            returncode = dot_process.wait()
+        if not dag_stream.found:
+            filename.unlink()
+            self.error("Could not generate dag!", exit=True)
+        if returncode:
+            self.error(f"dot exited with status {returncode}!", exit=True)
 
     @contextmanager
     def _copy_resources(
-        self, resources: List[Path], cleanup: bool, symlink_resources: bool = False
+        self,
+        resources: List[Path],
+        cleanup: bool,
+        symlink_resources: bool = False,
+        copy_if_symlink_fails: bool = True,
     ):
         """
         Copy resources to the current working directory.
         Args:
           resources (List[Path]): A list of paths to the resources to copy.
           cleanup (bool): If True, the resources will be removed after the function exits.
+          symlink_resources (bool): Symlink the resources instead of copying them.
+          copy_if_symlink_fails (bool): Copy the resources if they can't be symlinked
+            (e.g. on Windows without the symlink privilege), otherwise exit with an error.
         Side Effects:
           Copies the resources to the current working directory.
         Returns:
@@ -334,9 +385,17 @@ class RunApp(DynamicTyper):
         """
         import os
         import shutil
+        import stat
 
         copied_resources = []
 
+        def lstat_mode(path: Path):
+            """Return the st_mode of path (without following symlinks) or None if missing."""
+            try:
+                return os.lstat(path).st_mode
+            except FileNotFoundError:
+                return None
+
         def copy_resource(src: Path, dst: Path, symlink: bool = False):
             if self.verbose:
                 typer.secho(
@@ -345,16 +404,26 @@ class RunApp(DynamicTyper):
                 )
             target_is_directory = src.is_dir()
             if symlink:
-                os.symlink(src, dst, target_is_directory=target_is_directory)
-            elif target_is_directory:
+                try:
+                    os.symlink(src, dst, target_is_directory=target_is_directory)
+                    return
+                except OSError as e:
+                    if not copy_if_symlink_fails:
+                        self.error(f"Could not symlink resource '{src}': {e}")
+                    if self.verbose:
+                        typer.secho(
+                            f"  - Could not symlink resource '{src}', copying instead",
+                            fg=typer.colors.MAGENTA,
+                        )
+            if target_is_directory:
                 shutil.copytree(src, dst)
             else:
                 shutil.copy(src, dst)
 
-        def remove_resource(resource: Path):
-            if resource.is_symlink():
+        def remove_resource(resource: Path, mode: int):
+            if stat.S_ISLNK(mode):
                 resource.unlink()
-            elif resource.is_dir():
+            elif stat.S_ISDIR(mode):
                 shutil.rmtree(resource)
             else:
                 os.remove(resource)
@@ -371,7 +440,7 @@ class RunApp(DynamicTyper):
             for resource in resources:
                 abs_path = self.pipeline.path / resource
                 destination = Path(".") / resource.name
-                if not destination.exists():
+                if lstat_mode(destination) is None:
                     # make sure you don't delete files that are already there...
                     copy_resource(abs_path, destination, symlink=symlink_resources)
                     copied_resources.append(destination)
@@ -385,13 +454,84 @@ class RunApp(DynamicTyper):
             if not cleanup:
                 return
             for copied_resource in copied_resources:
-                if copied_resource.exists():
+                mode = lstat_mode(copied_resource)
+                if mode is not None:
                     if self.verbose:
                         typer.secho(
                             f"Deleting '{copied_resource.name}' resource...",
                             fg=typer.colors.MAGENTA,
                         )
-                    remove_resource(copied_resource)
+                    remove_resource(copied_resource, mode)
+
+
+def _rmtree_detached(paths: List[Path]):
+    """Delete directories in a detached process that outlives snk."""
+    import subprocess
+    import sys
+
+    subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import shutil, sys; [shutil.rmtree(p, ignore_errors=True) for p in sys.argv[1:]]",
+            *map(str, paths),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def remove_in_background(path: Path):
+    """
+    Remove a directory without waiting for it to be deleted.
+    Args:
+      path (Path): The directory to remove.
+    Side Effects:
+      Renames the directory so the path is free straight away, then deletes
+      it in a detached process. Falls back to deleting in place if the
+      directory can't be renamed.
+    Examples:
+      >>> remove_in_background(Path(".snakemake"))
+    """
+    import os
+    import shutil
+
+    trash = path.with_name(f"{path.name}.deleting.{os.getpid()}")
+    try:
+        path.rename(trash)
+    except OSError:
+        shutil.rmtree(path)
+        return
+    try:
+        _rmtree_detached([trash])
+    except OSError:
+        shutil.rmtree(trash)
+
+
+def remove_stale_deletions(path: Path):
+    """
+    Remove directories left behind by an interrupted remove_in_background.
+    Args:
+      path (Path): The directory that was removed in the background.
+    Side Effects:
+      The detached process is killed with its container or job, leaving the
+      renamed directory in place. Any that remain are deleted in the background.
+    Examples:
+      >>> remove_stale_deletions(Path(".snakemake"))
+    """
+    import glob
+    import shutil
+
+    stale = list(path.parent.glob(f"{glob.escape(path.name)}.deleting.*"))
+    if not stale:
+        return
+    try:
+        _rmtree_detached(stale)
+    except OSError:
+        for trash in stale:
+            shutil.rmtree(trash, ignore_errors=True)
 
 def check_command_available(command: str):
     """
@@ -407,42 +547,101 @@ def check_command_available(command: str):
 
     return shutil.which(command) is not None
 
+def _bool_parser(value):
+    """Parse the strings True and False (as snakemake does)."""
+    if value == "True":
+        return True
+    elif value == "False":
+        return False
+    raise ValueError
+
+
+def _yaml_safe_load(s):
+    """Load yaml string safely."""
+    import yaml
+
+    s = s.replace(": None", ": null")
+    return yaml.load(s, Loader=yaml.SafeLoader)
+
+
+def _yaml_safe_load_batch(values):
+    """Load yaml strings safely as a single document. Returns None if they can't be batched."""
+    import yaml
+
+    if any("\n" in v or "\r" in v or "&" in v for v in values):
+        # multiline values could leak into other entries and anchors could be aliased by them
+        return None
+    document = "\n".join(
+        f"{i}: {v.replace(': None', ': null')}" for i, v in enumerate(values)
+    )
+    try:
+        loaded = yaml.load(document, Loader=yaml.SafeLoader)
+    except yaml.YAMLError:
+        return None
+    if not isinstance(loaded, dict) or list(loaded) != list(range(len(values))):
+        return None
+    return list(loaded.values())
+
+
+_SCALAR_PARSERS = [int, float, _bool_parser]
+# values yaml reads differently on their own than as a mapping value
+_YAML_DOCUMENT_PREFIXES = ("---", "...", "#")
+_CONFIG_PARSERS = [*_SCALAR_PARSERS, _yaml_safe_load, str]
+
+
+def _parse_config_value(val, parsers=_CONFIG_PARSERS):
+    """Parse a config value with the first parser that succeeds."""
+    v = None
+    for parser in parsers:
+        try:
+            v = parser(val)
+            # avoid accidental interpretation as function
+            if not callable(v):
+                break
+        except:
+            pass
+    return v
+
+
 def parse_config_monkeypatch(args):
     """Monkeypatch the parse_config function from snakemake."""
-    import yaml
     import snakemake
-    import re
 
-    def _yaml_safe_load(s):
-        """Load yaml string safely."""
-        s = s.replace(": None", ": null")
-        return yaml.load(s, Loader=yaml.SafeLoader)
-
-    parsers = [int, float, snakemake._bool_parser, _yaml_safe_load, str]
     config = dict()
     if args.config is not None:
-        valid = re.compile(r"[a-zA-Z_]\w*$")
+        entries = []
         for entry in args.config:
             key, val = snakemake.parse_key_value_arg(
                 entry,
                 errmsg="Invalid config definition: Config entries have to be defined as name=value pairs.",
             )
-            if not valid.match(key):
+            if not _VALID_CONFIG_KEY.match(key):
                 raise ValueError(
                     "Invalid config definition: Config entry must start with a valid identifier."
                 )
-            v = None
+            entries.append((key, val))
+        values = [None] * len(entries)
+        # values that are not simple scalars are parsed as yaml in one go
+        unparsed = []
+        for i, (_, val) in enumerate(entries):
             if val == "" or val == "None":
-                snakemake.update_config(config, {key: v})
                 continue
-            for parser in parsers:
-                try:
-                    v = parser(val)
-                    # avoid accidental interpretation as function
-                    if not callable(v):
-                        break
-                except:
-                    pass
-            assert v is not None
+            v = _parse_config_value(val, _SCALAR_PARSERS)
+            if v is None and val.startswith(_YAML_DOCUMENT_PREFIXES):
+                # a document marker or comment on its own, which batching would change
+                v = _parse_config_value(val)
+                assert v is not None
+            if v is None:
+                unparsed.append(i)
+            else:
+                values[i] = v
+        if unparsed:
+            loaded = _yaml_safe_load_batch([entries[i][1] for i in unparsed])
+            if loaded is None:
+                loaded = [_parse_config_value(entries[i][1]) for i in unparsed]
+            for i, v in zip(unparsed, loaded):
+                assert v is not None
+                values[i] = v
+        for (key, _), v in zip(entries, values):
             snakemake.update_config(config, {key: v})
     return config
@@ -6,11 +6,7 @@ from typing import List
 import typer
 
 from snk.cli.dynamic_typer import DynamicTyper
-from snk.cli.workflow import create_workflow
 from snk.pipeline import Pipeline
-from rich.console import Console
-from rich.syntax import Syntax
-from snakemake.deployment.conda import Conda, Env
 from snk.cli.config.config import get_config_from_pipeline_dir
 
 
@@ -65,6 +61,8 @@ class ScriptApp(DynamicTyper):
         return env[0]
 
     def _shellcmd(self, env_address: str, cmd: str) -> str:
+        from snakemake.deployment.conda import Conda
+
         if sys.platform.lower().startswith("win"):
             return Conda().shellcmd_win(env_address, cmd)
         return Conda().shellcmd(env_address, cmd)
@@ -76,6 +74,9 @@ class ScriptApp(DynamicTyper):
             False, "--pretty", "-p", help="Pretty print the script."
         ),
     ):
+        from rich.console import Console
+        from rich.syntax import Syntax
+
         env_path = self._get_script_path(name)
         with open(env_path) as f:
             code = f.read()
@@ -112,6 +113,9 @@ class ScriptApp(DynamicTyper):
         executor = self._get_executor(script_path.suffix[1:])
         cmd = [executor, str(script_path)] + args
         if env:
+            from snakemake.deployment.conda import Env
+            from snk.cli.workflow import create_workflow
+
             env_path = self._get_conda_env_path(env)
             workflow = create_workflow(
                 self.snakefile,
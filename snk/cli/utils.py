@@ -12,6 +12,27 @@ else:
 from snk.cli.options import Option
 
 
+def walk(d, parent_key="", sep=":"):
+    """
+    Walks a nested dictionary, yielding the joined key of every leaf.
+    Args:
+      d (dict): The dictionary to walk.
+      parent_key (str, optional): The parent key of the dictionary. Defaults to ''.
+      sep (str, optional): The separator to use between keys. Defaults to ':'.
+    Yields:
+      (str, any): The joined key and value of each leaf.
+    Examples:
+      >>> list(walk({'a': {'b': 1, 'c': 2}, 'd': 3}))
+      [('a:b', 1), ('a:c', 2), ('d', 3)]
+    """
+    for k, v in d.items():
+        new_key = parent_key + sep + k if parent_key else k
+        if isinstance(v, MutableMapping):
+            yield from walk(v, new_key, sep=sep)
+        else:
+            yield new_key, v
+
+
 def flatten(d, parent_key="", sep=":"):
     """
     Flattens a nested dictionary.
@@ -26,14 +47,7 @@ def flatten(d, parent_key="", sep=":"):
       >>> flatten(d)
       {'a:b': 1, 'a:c': 2, 'd': 3}
     """
-    items = []
-    for k, v in d.items():
-        new_key = parent_key + sep + k if parent_key else k
-        if isinstance(v, MutableMapping):
-            items.extend(flatten(v, new_key, sep=sep).items())
-        else:
-            items.append((new_key, v))
-    return dict(items)
+    return dict(walk(d, parent_key, sep=sep))
 
 
 def convert_key_to_snakemake_format(key, value, sep=":"):
@@ -63,15 +77,18 @@ def serialise(d):
       >>> serialise({'a': 1, 'b': 2})
       {'a': '1', 'b': '2'}
     """
-    if isinstance(d, Path) or isinstance(d, datetime):
+    if d is None or type(d) in (str, int, float, bool):
+        # fast path for the common scalar values
+        return d
+
+    if isinstance(d, (Path, datetime)):
         return str(d)
 
     if isinstance(d, list):
         return [serialise(x) for x in d]
 
     if isinstance(d, dict):
-        for k, v in d.items():
-            d.update({k: serialise(v)})
+        return {k: serialise(v) for k, v in d.items()}
 
     # return anything else, like a string or number
     return d
@@ -84,35 +101,34 @@ def parse_config_args(args: List[str], options: List[Option]):
       args (List[str]): A list of arguments.
       options (List[Option]): A list of options.
     Returns:
-      (List[str], List[dict]): A tuple of parsed arguments and config.
+      (List[str], List[tuple]): A tuple of parsed arguments and (key, value) config pairs.
     Examples:
       >>> parse_config_args(['-name', 'John', '-age', '20'], [{'name': 'name', 'default': '', 'help': '', 'type': 'str', 'required': True}, {'name': 'age', 'default': '', 'help': '', 'type': 'int', 'required': True}])
-      (['John', '20'], [{'name': 'name', 'John'}, {'age': 20}])
+      (['John', '20'], [('name', 'John'), ('age', 20)])
     """
-    names = [op.name for op in options]
+    options_by_name = {op.name: op for op in options}
     config = []
     parsed: List[str] = []
-    flag = None
+    op = None
     for arg in args:
-        if flag:
-            name = flag.lstrip("-")
-            op = next(op for op in options if op.name == name)
+        if op is not None:
+            name = op.name
             if op.updated is False and op.default == serialise(arg):
                 # skip args that don't change
-                flag = None
+                op = None
                 continue
             if ":" in op.original_key:
-                samkemake_format_config = convert_key_to_snakemake_format(
-                    op.original_key, arg
-                )
-                name = list(samkemake_format_config.keys())[0]
-                arg = samkemake_format_config[name]
-            config.append({name: serialise(arg)})
-            flag = None
-            continue
-        if arg.startswith("-") and arg.lstrip("-") in names:
-            flag = arg
+                # nest the value under the top level key e.g. a:b:c -> a={'b': {'c': value}}
+                name, *parts = op.original_key.split(":")
+                for part in reversed(parts):
+                    arg = {part: arg}
+            config.append((name, serialise(arg)))
+            op = None
             continue
+        if arg.startswith("-"):
+            op = options_by_name.get(arg.lstrip("-"))
+            if op is not None:
+                continue
         parsed.append(arg)
     parsed.sort()
     return parsed, config
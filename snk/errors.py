@@ -21,4 +21,7 @@ class InvalidSnkConfigError(SnkConfigError, ValueError):
     """Thrown if the given SNK config appears to have an invalid format."""
 
 class MissingSnkConfigError(SnkConfigError, FileNotFoundError):
-    """Thrown if the given SNK config file cannot be found."""
\ No newline at end of file
+    """Thrown if the given SNK config file cannot be found."""
+
+class InvalidConfigFileError(ValueError):
+    """Thrown if a config file is not a valid JSON or YAML mapping."""
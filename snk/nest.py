@@ -1,10 +1,9 @@
 from pathlib import Path
-from git import InvalidGitRepositoryError, Repo, GitCommandError
 import sys
 import stat
 import inspect
 import os
-from typing import List
+from typing import List, TYPE_CHECKING
 import shutil
 
 from .errors import (
@@ -15,6 +14,9 @@ from .errors import (
 from .cli.config.config import SnkConfig
 from .pipeline import Pipeline
 
+if TYPE_CHECKING:
+    from git import Repo
+
 
 class Nest:
     """
@@ -343,10 +345,7 @@ class Nest:
 
     @property
     def pipelines(self):
-        return [
-            Pipeline(pipeline_dir.absolute())
-            for pipeline_dir in self.snk_pipelines_dir.glob("*")
-        ]
+        return Pipeline.scan_all(self.snk_pipelines_dir)
 
     def download(self, repo_url: str, name: str, tag_name: str = None) -> Path:
         """
@@ -365,6 +364,8 @@ class Nest:
         options = ["--depth 1", "--single-branch"]
         if tag_name:
             options.append(f"--branch {tag_name}")
+        from git import Repo, GitCommandError
+
         try:
             repo = Repo.clone_from(repo_url, location, multi_options=options)
             repo.git.checkout(tag_name)
@@ -388,6 +389,8 @@ class Nest:
             os.symlink(path.absolute(), location, target_is_directory=True)
             return location
         shutil.copytree(path, location)
+        from git import Repo, InvalidGitRepositoryError
+
         try:
             Repo(location)
         except InvalidGitRepositoryError:
@@ -449,7 +452,7 @@ class Nest:
             )
         return self.bin_dir / name
 
-    def validate_SnakeMake_repo(self, repo: Repo):
+    def validate_SnakeMake_repo(self, repo: "Repo"):
         """
         Validates a SnakeMake repository.
         Args:
@@ -1,9 +1,30 @@
+import os
+from functools import lru_cache
 from pathlib import Path
 import sys
-from typing import Optional
-from git import Repo, InvalidGitRepositoryError
+from typing import Dict, List, Optional
 
-from snk.cli.config.utils import get_version_from_config
+try:
+    from functools import cached_property
+except ImportError:  # python 3.7
+    cached_property = property
+
+from snk.cli.config.utils import get_version_from_config, load_configfile
+
+_EXE_SUFFIX = ".exe" if sys.platform.startswith("win") else ""
+
+# pipeline asset folders and the entries in them that count as assets
+_ASSET_FILTERS = {
+    "profiles": lambda e: e.is_dir(),
+    "envs": lambda e: e.name.endswith((".yaml", ".yml")) and e.is_file(),
+    "scripts": lambda e: e.is_file(),
+}
+
+
+@lru_cache(maxsize=128)
+def _get_config_version(config_path: str, mtime_ns: int):
+    """Get the version field of a config file, cached until the file is modified."""
+    return load_configfile(Path(config_path)).get("version")
 
 
 class Pipeline:
@@ -13,8 +34,14 @@ class Pipeline:
       path (Path): The path to the pipeline.
       repo (Repo): The git repository of the pipeline.
       name (str): The name of the pipeline.
+    Notes:
+      Properties are computed on first access and cached on the instance, so a
+      Pipeline reflects the state of the pipeline directory when first inspected.
     """
 
+    # __dict__ is kept for the cached properties
+    __slots__ = ("path", "repo", "name", "_path_str", "__dict__")
+
     def __init__(self, path: Path) -> None:
         """
         Initializes a Pipeline object.
@@ -25,88 +52,165 @@ class Pipeline:
         Notes:
             Initializes the `repo` and `name` attributes.
         """
+        self._init(path, editable=path.is_symlink())
+
+    def _init(self, path: Path, editable: bool) -> None:
+        """Sets the pipeline attributes, given whether the path is a symlink."""
         self.path = path
-        if path.is_symlink():  # editable mode
+        self._path_str = os.fspath(path)
+        if editable:
+            self.repo = None
+        elif not os.path.exists(os.path.join(self._path_str, ".git")):
+            # not a git repo, skip the (slower) search by GitPython
             self.repo = None
         else:
+            from git import Repo, InvalidGitRepositoryError, GitDB
+
             try:
-                self.repo = Repo(path)
+                # GitDB reads objects in python, without a git cat-file process
+                self.repo = Repo(path, odbt=GitDB)
             except InvalidGitRepositoryError:
                 self.repo = None
         self.name = self.path.name
 
-    @property
+    @classmethod
+    def scan_all(cls, root: Path) -> List["Pipeline"]:
+        """
+        Creates a Pipeline for every pipeline directory in root.
+        Args:
+            root (Path): The directory containing the pipelines.
+        Returns:
+            List[Pipeline]: The pipelines found in root.
+        Raises:
+            FileNotFoundError: If root does not exist.
+        Notes:
+            Uses a single scandir of root so the entries' symlink status is
+            known without stat-ing each pipeline path again.
+        """
+        pipelines = []
+        with os.scandir(root.absolute()) as entries:
+            for entry in entries:
+                # keep broken editable installs (dangling symlinks) listed
+                if not (entry.is_dir() or entry.is_symlink()):
+                    continue
+                pipeline = cls.__new__(cls)
+                pipeline._init(Path(entry.path), editable=entry.is_symlink())
+                pipelines.append(pipeline)
+        return pipelines
+
+    @cached_property
     def tag(self):
         """
         Gets the tag of the pipeline.
         Returns:
             str: The tag of the pipeline, or None if no tag is found.
         """
+        if self.repo is None:
+            return None
+        from git.exc import BadObject
+
+        tags = self.repo.tags
+        if not tags:
+            return None
         try:
             # TODO: default to commit
-            tag = self.repo.git.describe(["--tags", "--exact-match"])
-        except Exception:
-            tag = None
-        return tag
+            head = self.repo.head.commit.hexsha
+        except ValueError:  # no commits yet
+            return None
+        # pick the tag as 'git describe --tags --exact-match' would: annotated
+        # tags before lightweight ones, then the most recently tagged
+        best, best_key = None, None
+        for tag in sorted(tags, key=lambda t: t.path):
+            try:
+                obj = tag.object
+                annotated = obj.type == "tag"
+                key = (1, obj.tagged_date) if annotated else (0, 0)
+                while obj.type == "tag":
+                    obj = obj.object
+            except (ValueError, BadObject):  # dangling tag
+                continue
+            if obj.type != "commit" or obj.hexsha != head:
+                continue
+            if best_key is None or key > best_key:
+                best, best_key = tag.name, key
+        return best
     
-    @property
+    @cached_property
     def version(self):
         """
         Gets the version of the pipeline.
         Returns:
             str: The version of the pipeline, or None if no version is found.
         """
-        if (self.path / "snk.yaml").exists():
-            version = get_version_from_config(self.path / "snk.yaml")
-        else:
+        snk_config_path = os.path.join(self._path_str, "snk.yaml")
+        try:
+            mtime_ns = os.stat(snk_config_path).st_mtime_ns
+        except FileNotFoundError:
             version = self.tag
+        else:
+            version = _get_config_version(snk_config_path, mtime_ns)
+            if version is not None:
+                # not cached, the version may be read from an __about__.py file
+                version = get_version_from_config(
+                    Path(snk_config_path), {"version": version}
+                )
         return version if version else "latest"
 
-    @property
+    @cached_property
     def executable(self):
         """
         Gets the executable of the pipeline.
         Returns:
             Path: The path to the pipeline executable.
         """
-        pipeline_bin_dir = self.path.parent.parent / "bin"
-        name = self.name
-        if sys.platform.startswith("win"):
-            name += ".exe"
-        return pipeline_bin_dir / name
+        pipeline_bin_dir = os.path.join(
+            os.path.dirname(os.path.dirname(self._path_str)), "bin"
+        )
+        return Path(os.path.join(pipeline_bin_dir, self.name + _EXE_SUFFIX))
 
-    @property
+    @cached_property
     def editable(self):
         """Is the pipeline editable?"""
         return self.path.is_symlink()
 
+    @cached_property
+    def _folder_index(self) -> Dict[str, Path]:
+        """Map folder names in the pipeline (and its workflow dir) to their paths"""
+        index = {}
+        # folders in the pipeline root take precedence over those in workflow/
+        for directory in (os.path.join(self._path_str, "workflow"), self._path_str):
+            try:
+                with os.scandir(directory) as entries:
+                    index.update({e.name: Path(e.path) for e in entries if e.is_dir()})
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+        return index
+
     def _find_folder(self, name) -> Optional[Path]:
         """Search for folder"""
-        if (self.path / name).exists():
-            return self.path / name
-        if (self.path / "workflow" / name).exists():
-            return self.path / "workflow" / name
-        return None
+        return self._folder_index.get(name)
+
+    @cached_property
+    def _assets(self) -> Dict[str, List[Path]]:
+        """Scan the profiles, envs and scripts folders in one pass"""
+        assets = {}
+        for name, is_asset in _ASSET_FILTERS.items():
+            folder = self._find_folder(name)
+            if not folder:
+                assets[name] = []
+                continue
+            with os.scandir(folder) as entries:
+                assets[name] = [Path(e.path) for e in entries if is_asset(e)]
+        return assets
 
     @property
-    def profiles(self):
-        pipeline_profile_dir = self._find_folder("profiles")
-        if pipeline_profile_dir:
-            return [p for p in pipeline_profile_dir.glob("*") if p.is_dir()]
-        return []
+    def profiles(self) -> List[Path]:
+        return self._assets["profiles"]
 
     @property
-    def environments(self):
-        pipeline_environments_dir = self._find_folder("envs")
-        if pipeline_environments_dir:
-            return [e for e in pipeline_environments_dir.glob("*.yaml")] + [
-                e for e in pipeline_environments_dir.glob("*.yml")
-            ]
-        return []
+    def environments(self) -> List[Path]:
+        return self._assets["envs"]
 
     @property
-    def scripts(self):
-        pipeline_environments_dir = self._find_folder("scripts")
-        if pipeline_environments_dir:
-            return [s for s in pipeline_environments_dir.iterdir() if s.is_file()]
-        return []
+    def scripts(self) -> List[Path]:
+        return self._assets["scripts"]
@@ -4,30 +4,31 @@ from snk.cli.options import Option
 from snk.cli.options.utils import (
     create_option_from_annotation,
     build_dynamic_cli_options,
+    group_annotations,
 )
 
 
 @pytest.fixture
 def default_annotation_values():
     return {
-        "test:name": "Test",
-        "test:default": "default_value",
-        "test:type": "str",
-        "test:help": "Test help",
-        "test:required": True,
+        "name": "Test",
+        "default": "default_value",
+        "type": "str",
+        "help": "Test help",
+        "required": True,
     }
 
 
 @pytest.fixture
-def default_default_values():
-    return {"test": "default_value"}
+def default_config_default():
+    return "default_value"
 
 
 def test_create_option_from_annotation(
-    default_annotation_values, default_default_values
+    default_annotation_values, default_config_default
 ):
     option = create_option_from_annotation(
-        "test", default_annotation_values, default_default_values
+        "test", default_annotation_values, default_config_default
     )
 
     assert isinstance(option, Option)
@@ -39,6 +40,17 @@ def test_create_option_from_annotation(
     assert option.required == True
 
 
+def test_group_annotations():
+    annotations = {
+        "a": {"default": 1, "type": "int"},
+        "b": {"c": {"help": "Nested", "short": "c"}},
+    }
+    assert group_annotations(annotations) == {
+        "a": {"default": 1, "type": "int"},
+        "b:c": {"help": "Nested", "short": "c"},
+    }
+
+
 # @pytest.mark.parametrize("annotation_values, default_values, expected_type", [
 #     ({"test:type": "str"}, {}, str),
 # ])
@@ -1,5 +1,6 @@
 from pathlib import Path
-from snk.cli.utils import flatten, convert_key_to_snakemake_format
+from snk.cli.utils import flatten, convert_key_to_snakemake_format, serialise, parse_config_args
+from snk.cli.options import Option
 import snakemake
 import pytest
 from ..utils import CLIRunner
@@ -24,10 +25,34 @@ def test_convert_key_to_snakemake_format(key, value, expected):
     assert convert_key_to_snakemake_format(key, value) == expected
 
 
+def test_serialise_nested_dict():
+    d = {"a": {"b": Path("x")}, "c": [Path("y"), 1]}
+    assert serialise(d) == {"a": {"b": "x"}, "c": ["y", 1]}
+    assert d["a"]["b"] == Path("x")
+
+
+def test_parse_config_args_nested_key():
+    option = Option(
+        name="a_b_c", original_key="a:b:c", default=1, updated=False,
+        help="", type=int, required=False, short=None,
+    )
+    parsed, config = parse_config_args(["--a_b_c", 2, "target"], [option])
+    assert parsed == ["target"]
+    assert config == [("a", {"b": {"c": 2}})]
+
+
 def test_help(local_runner: CLIRunner):
     res = local_runner(["--help"])
     assert res.code == 0, res.stderr
     assert "Usage:" in res.stdout
+    assert "A pipeline to test the pipeline logo and tagline" in res.stdout
+
+
+def test_no_command_shows_logo(local_runner: CLIRunner):
+    res = local_runner([])
+    assert res.code == 0, res.stderr
+    assert "Usage:" in res.stdout
+    assert "A pipeline to test the pipeline logo and tagline" in res.stdout
 
 
 def test_info(local_runner: CLIRunner):
@@ -51,3 +76,74 @@ def test_dag(local_runner: CLIRunner, tmp_path, filetype):
     res = local_runner(["run", "--dag", f"{tmp_path}/dag.{filetype}"])
     assert res.code == 0, res.stderr
     assert Path(f"{tmp_path}/dag.{filetype}").exists()
+
+
+def test_load_configfile_matches_snakemake(example_config: Path):
+    from snk.cli.config.utils import load_configfile
+
+    assert load_configfile(example_config) == snakemake.load_configfile(example_config)
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ("a:\n\tb: 1\n", "tab indentation"),
+        ("- a\n- b\n", "keys at top level"),
+        ("", "keys at top level"),
+    ],
+)
+def test_load_configfile_invalid(tmp_path: Path, text, message):
+    from snk.cli.config.utils import load_configfile
+    from snk.errors import InvalidConfigFileError
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(text)
+    with pytest.raises(InvalidConfigFileError, match=message) as e:
+        load_configfile(config_path)
+    assert str(config_path) in str(e.value)
+
+
+def test_version_does_not_import_snakemake():
+    import subprocess
+    import sys
+
+    code = "\n".join(
+        [
+            "import sys",
+            "from pathlib import Path",
+            "from snk.cli import CLI",
+            "sys.argv = ['pipeline', '--version']",
+            "try:",
+            "    CLI(Path('tests/data/pipeline'))()",
+            "except SystemExit as e:",
+            "    assert not e.code, e.code",
+            "assert 'snakemake' not in sys.modules and 'art' not in sys.modules",
+        ]
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == "0.13.0"
+
+
+def test_snakefile_from_snk_config(tmp_path: Path, monkeypatch):
+    from typer.testing import CliRunner
+    from snk.cli import CLI
+
+    (tmp_path / "rules").mkdir()
+    (tmp_path / "rules" / "main.smk").write_text("rule from_snk_config:\n    shell: 'echo hi'\n")
+    (tmp_path / "snk.yaml").write_text("snakefile: rules/main.smk\n")
+    cli = CLI(tmp_path)
+    assert cli.snakefile == tmp_path / "rules" / "main.smk"
+    monkeypatch.chdir(tmp_path)
+    res = CliRunner().invoke(cli.app, ["run", "-n"])
+    assert res.exit_code == 0, res.output
+    assert "from_snk_config" in res.output
+
+
+def test_snakefile_from_snk_config_missing(tmp_path: Path):
+    from snk.cli import CLI
+
+    (tmp_path / "Snakefile").write_text("")
+    (tmp_path / "snk.yaml").write_text("snakefile: rules/main.smk\n")
+    with pytest.raises(FileNotFoundError, match="main.smk"):
+        CLI(tmp_path)
@@ -1,5 +1,13 @@
 from pathlib import Path
+from types import SimpleNamespace
+import pytest
 from snk.cli.utils import flatten, convert_key_to_snakemake_format
+from snk.cli.subcommands.run import (
+    _DagStream,
+    parse_config_monkeypatch,
+    remove_in_background,
+    remove_stale_deletions,
+)
 from ..utils import CLIRunner
 
 
@@ -15,3 +23,121 @@ def test_config_override(local_runner: CLIRunner):
 def test_exit_on_fail(local_runner: CLIRunner):
     res = local_runner(["run", "-f", "error"])
     assert res.code == 1, res.stderr
+
+
+@pytest.mark.parametrize(
+    "config, expected",
+    [
+        (["a=1", "b=2.5", "c=True", "d=", "e=None"], {"a": 1, "b": 2.5, "c": True, "d": None, "e": None}),
+        (["a=[1, 2]", "b=hello world", "c={'x': {'y': 1}}", "c={'x': {'z': 2}}"], {"a": [1, 2], "b": "hello world", "c": {"x": {"y": 1, "z": 2}}}),
+        # entries that can't be loaded as a single yaml document
+        (["a=*.txt", "b=x: y", "c=- z"], {"a": "*.txt", "b": {"x": "y"}, "c": ["z"]}),
+        # the same value in a batch that loads, and one that falls back
+        (["a=--- [1]", "b=[2]"], {"a": [1], "b": [2]}),
+        (["a=--- [1]", "b=*.txt"], {"a": [1], "b": "*.txt"}),
+    ],
+)
+def test_parse_config_monkeypatch(config, expected):
+    assert parse_config_monkeypatch(SimpleNamespace(config=config)) == expected
+
+
+@pytest.mark.parametrize(
+    "config",
+    [["a=---"], ["a=---", "b=*.txt"], ["a=#x", "b=[1]"], ["a=~"], ["a=null", "b=*.txt"]],
+)
+def test_parse_config_monkeypatch_null_value(config):
+    with pytest.raises(AssertionError):
+        parse_config_monkeypatch(SimpleNamespace(config=config))
+
+
+def test_parse_config_monkeypatch_invalid_key():
+    with pytest.raises(ValueError):
+        parse_config_monkeypatch(SimpleNamespace(config=["1a=1"]))
+
+
+def _wait_until_removed(path: Path, timeout: float = 10):
+    import time
+
+    deadline = time.monotonic() + timeout
+    while path.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return not path.exists()
+
+
+def test_remove_in_background(tmp_path: Path):
+    import os
+
+    snakemake_dir = tmp_path / ".snakemake"
+    (snakemake_dir / "log").mkdir(parents=True)
+    remove_in_background(snakemake_dir)
+    assert not snakemake_dir.exists()
+    assert _wait_until_removed(tmp_path / f".snakemake.deleting.{os.getpid()}")
+
+
+def test_remove_in_background_rename_fails(tmp_path: Path):
+    import os
+
+    # left over from an earlier run whose deletion was killed
+    trash = tmp_path / f".snakemake.deleting.{os.getpid()}"
+    (trash / "log").mkdir(parents=True)
+    snakemake_dir = tmp_path / ".snakemake"
+    (snakemake_dir / "log").mkdir(parents=True)
+    remove_in_background(snakemake_dir)
+    assert not snakemake_dir.exists()
+
+
+def test_remove_stale_deletions(tmp_path: Path):
+    snakemake_dir = tmp_path / ".snakemake"
+    snakemake_dir.mkdir()
+    stale = tmp_path / ".snakemake.deleting.1"
+    (stale / "log").mkdir(parents=True)
+    remove_stale_deletions(snakemake_dir)
+    assert _wait_until_removed(stale)
+    assert snakemake_dir.exists()
+
+
+def test_dag_stream_marker_split_across_writes():
+    import io
+
+    out = io.BytesIO()
+    stream = _DagStream(out)
+    stream.write("Building DAG of jobs...\ndigraph snake")
+    assert not stream.found
+    assert out.getvalue() == b""
+    stream.write("make_dag {\n\tgraph[];\n")
+    stream.write("}\n")
+    assert stream.found
+    assert out.getvalue() == b"digraph snakemake_dag {\n\tgraph[];\n}\n"
+
+
+def _failing_symlink(*args, **kwargs):
+    raise OSError("symbolic link privilege not held")
+
+
+def test_resources_copied_if_symlink_fails(tmp_path: Path, monkeypatch):
+    import os
+    from typer.testing import CliRunner
+    from snk.cli import CLI
+
+    cli = CLI(Path("tests/data/pipeline").absolute())
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(os, "symlink", _failing_symlink)
+    res = CliRunner().invoke(cli.app, ["run", "-n", "--keep-resources", "--verbose"])
+    assert res.exit_code == 0, res.output
+    assert "copying instead" in res.output
+    assert (tmp_path / "resources" / "data.txt").exists()
+    assert not (tmp_path / "resources").is_symlink()
+
+
+def test_resources_symlink_flag_fails_if_symlink_fails(tmp_path: Path, monkeypatch):
+    import os
+    from typer.testing import CliRunner
+    from snk.cli import CLI
+
+    cli = CLI(Path("tests/data/pipeline").absolute())
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(os, "symlink", _failing_symlink)
+    res = CliRunner().invoke(cli.app, ["run", "-n", "--symlink-resources"])
+    assert res.exit_code == 1
+    assert "Could not symlink resource" in res.output
+    assert not (tmp_path / "resources").exists()
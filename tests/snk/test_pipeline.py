@@ -0,0 +1,106 @@
+import os
+from pathlib import Path
+
+from snk.pipeline import Pipeline
+
+
+def test_pipeline_assets():
+    pipeline = Pipeline(Path("tests/data/pipeline"))
+    assert [p.name for p in pipeline.profiles] == ["base"]
+    assert sorted(e.name for e in pipeline.environments) == ["base.yml", "pandas.yml"]
+    assert [s.name for s in pipeline.scripts] == ["hello.py"]
+
+
+def test_pipeline_without_assets(tmp_path: Path):
+    pipeline = Pipeline(tmp_path)
+    assert pipeline.profiles == []
+    assert pipeline.environments == []
+    assert pipeline.scripts == []
+
+
+def test_pipeline_tag(tmp_path: Path):
+    from git import Repo
+
+    repo = Repo.init(tmp_path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "snk")
+        config.set_value("user", "email", "snk@example.com")
+    assert Pipeline(tmp_path).tag is None  # no commits
+    (tmp_path / "Snakefile").write_text("")
+    repo.index.add(["Snakefile"])
+    repo.index.commit("init")
+    assert Pipeline(tmp_path).tag is None
+    repo.create_tag("v0.1.0")
+    assert Pipeline(tmp_path).tag == "v0.1.0"
+    (tmp_path / "config.yaml").write_text("")
+    repo.index.add(["config.yaml"])
+    repo.index.commit("untagged")
+    assert Pipeline(tmp_path).tag is None
+    repo.create_tag("a-blob", ref=repo.head.commit.tree / "Snakefile")
+    assert Pipeline(tmp_path).tag is None
+    repo.create_tag("v0.2.0", message="annotated")
+    assert Pipeline(tmp_path).tag == "v0.2.0"
+
+
+def test_pipeline_tag_prefers_annotated(tmp_path: Path, monkeypatch):
+    import git.cmd
+    from git import Repo
+
+    repo = Repo.init(tmp_path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "snk")
+        config.set_value("user", "email", "snk@example.com")
+    (tmp_path / "Snakefile").write_text("")
+    repo.index.add(["Snakefile"])
+    repo.index.commit("init")
+    repo.create_tag("v1")
+    repo.create_tag("v2", message="annotated")
+    repo.git.tag("v3", message="newer", env={"GIT_COMMITTER_DATE": "2099-01-01T00:00:00+0000"})
+    repo.git.pack_refs("--all")
+    assert repo.git.describe("--tags", "--exact-match") == "v3"
+
+    def no_subprocess(*args, **kwargs):
+        raise AssertionError(f"unexpected subprocess {args[0]}")
+
+    monkeypatch.setattr(git.cmd, "Popen", no_subprocess)
+    assert Pipeline(tmp_path).tag == "v3"
+
+
+def test_pipeline_root_folders_take_precedence(tmp_path: Path):
+    (tmp_path / "workflow" / "scripts").mkdir(parents=True)
+    (tmp_path / "workflow" / "scripts" / "workflow.py").write_text("")
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "root.py").write_text("")
+    assert [s.name for s in Pipeline(tmp_path).scripts] == ["root.py"]
+
+
+def test_pipeline_version(tmp_path: Path):
+    assert Pipeline(tmp_path).version == "latest"
+    snk_config = tmp_path / "snk.yaml"
+    snk_config.write_text("version: 0.1.0\n")
+    assert Pipeline(tmp_path).version == "0.1.0"
+    snk_config.write_text("version: 0.2.0\n")
+    os.utime(snk_config, ns=(0, snk_config.stat().st_mtime_ns + 1))
+    assert Pipeline(tmp_path).version == "0.2.0"
+
+
+def test_pipeline_version_from_about_file(tmp_path: Path):
+    (tmp_path / "snk.yaml").write_text("version: __about__.py\n")
+    about = tmp_path / "__about__.py"
+    about.write_text('__version__ = "0.1.0"\n')
+    assert Pipeline(tmp_path).version == "0.1.0"
+    about.write_text('__version__ = "0.2.0"\n')
+    assert Pipeline(tmp_path).version == "0.2.0"
+
+
+def test_pipeline_scan_all(tmp_path: Path):
+    (tmp_path / "installed").mkdir()
+    (tmp_path / "not-a-pipeline.txt").write_text("")
+    os.symlink(Path("tests/data/pipeline").absolute(), tmp_path / "editable")
+    os.symlink(tmp_path / "deleted", tmp_path / "broken")
+    pipelines = {p.name: p for p in Pipeline.scan_all(tmp_path)}
+    assert sorted(pipelines) == ["broken", "editable", "installed"]
+    assert pipelines["broken"].editable
+    assert pipelines["editable"].editable
+    assert not pipelines["installed"].editable
+    assert pipelines["installed"].path == tmp_path.absolute() / "installed"
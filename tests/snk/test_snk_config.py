@@ -8,7 +8,7 @@ def test_snk_config_creation():
     assert snk_config.font == "small"
     assert snk_config.resources == []
     assert snk_config.cli == {}
-    assert snk_config.symlink_resources == False
+    assert snk_config.symlink_resources == True
     assert snk_config.version == None
 
 